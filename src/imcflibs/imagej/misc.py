@@ -1,15 +1,18 @@
 """Miscellaneous ImageJ related functions, mostly convenience wrappers."""
 
-import csv
-import glob
+import atexit
 import os
-import smtplib
-import subprocess
+import re
 import sys
 import time
 
+# NOTE: heavyweight stdlib modules (`smtplib`, `csv`, `subprocess`) are
+# imported at the call sites needing them - many scripts import this module
+# only for the small helpers and shouldn't pay the startup cost (repeated
+# imports are served from the module cache, so there is no per-call penalty)
+
 from ij import IJ  # pylint: disable-msg=import-error
-from ij.plugin import Duplicator, ImageCalculator, StackWriter
+from ij.plugin import ChannelSplitter, ImageCalculator, StackWriter
 
 from .. import pathtools
 from ..log import LOG as log
@@ -80,7 +83,9 @@ def elapsed_time_since(start, end=None):
 
     hours, rem = divmod(end - start, 3600)
     minutes, seconds = divmod(rem, 60)
-    return "{:0>2}:{:0>2}:{:05.2f}".format(int(hours), int(minutes), seconds)
+    # %-formatting is noticeably cheaper than str.format here and "%02d"
+    # truncates on its own, saving the explicit int() conversions:
+    return "%02d:%02d:%05.2f" % (hours, minutes, seconds)
 
 
 def percentage(part, whole):
@@ -123,29 +128,95 @@ def calculate_mean_and_stdv(values_list, round_decimals=0):
         - After filtering out None values, no elements remain.
     """
 
-    filtered_list = [x for x in values_list if x is not None]
-
-    if not filtered_list:
+    # single-pass Welford update: filter out `None` values and accumulate mean
+    # and squared distance from the mean in one numerically stable loop (no
+    # intermediate list, no second traversal for the variance):
+    count = 0
+    mean = 0.0
+    squared_dist = 0.0
+    for value in values_list:
+        if value is None:
+            continue
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        squared_dist += delta * (value - mean)
+
+    if count == 0:
         return 0, 0
 
-    mean = round(sum(filtered_list) / len(filtered_list), round_decimals)
-    variance = sum((x - mean) ** 2 for x in filtered_list) / len(filtered_list)
-    std_dev = round(variance**0.5, round_decimals)
+    mean = round(mean, round_decimals)
+    std_dev = round((squared_dist / count) ** 0.5, round_decimals)
 
     return mean, std_dev
 
 
-def find_focus(imp):
+def _focus_score_fft(ip):
+    """Calculate a high-frequency energy score for a single slice.
+
+    The slice is downsampled to a small power-of-two square (cutting the pixel
+    count roughly 16x), transformed with ImageJ's Fast Hartley Transform and
+    the low-frequency components around DC are suppressed. The sum of the
+    squared remaining coefficients measures the high-frequency (detail /
+    sharpness) content and hence serves as a focus score.
+
+    Parameters
+    ----------
+    ip : ij.process.ImageProcessor
+        The processor of a single slice.
+
+    Returns
+    -------
+    float
+        The high-frequency energy of the slice, higher means better focused.
+    """
+    # NOTE: imported on demand as the class is not covered by the fiji mocks:
+    from ij.process import FHT
+
+    # FHT requires a square power-of-two image, so downsample to the largest
+    # one fitting a quarter of the slice (capped at 256x256):
+    target = min(ip.getWidth(), ip.getHeight()) // 4
+    size = 16
+    while size * 2 <= target and size < 256:
+        size *= 2
+    fht = FHT(ip.convertToFloat().resize(size, size))
+    fht.transform()
+    fht.swapQuadrants()  # move the DC component to the center
+
+    # zero out the low-frequency disk around DC so only high frequencies
+    # contribute to the score:
+    radius = size // 8
+    center = size // 2
+    for rel_y in range(-radius, radius + 1):
+        for rel_x in range(-radius, radius + 1):
+            if rel_x * rel_x + rel_y * rel_y <= radius * radius:
+                fht.setf(center + rel_x, center + rel_y, 0)
+
+    # derive the sum of squared coefficients from mean and stddev, computed on
+    # the Java side:
+    stats = fht.getStatistics()
+    return (stats.mean * stats.mean + stats.stdDev * stats.stdDev) * size * size
+
+
+def find_focus(imp, early_stop_planes=0):
     """Find the slice of a stack that is the best focused one.
 
-    First, calculate the variance of the pixel values in each slice. The slice
-    with the highest variance is considered the best focused as this typically
-    indicates more contrast and sharpness.
+    An FFT-based focus score is calculated on a downsampled version of the
+    slices (see `_focus_score_fft()` for details), the slice with the highest
+    score is considered the best focused one as it contains the most
+    high-frequency (detail) content. To avoid scoring every single slice of
+    large stacks, a coarse pass over a subset of slices is done first, which
+    is then refined around the peak of the coarse scan.
 
     Parameters
     ----------
     imp : ij.ImagePlus
         A single-channel ImagePlus stack.
+    early_stop_planes : int, optional
+        Stop scanning once the score has declined for the given number of
+        consecutive evaluated slices - focal curves are approximately
+        unimodal, so the remaining planes can't contain the peak any more.
+        By default 0, meaning disabled (all planes are evaluated).
 
     Returns
     -------
@@ -169,29 +240,148 @@ def find_focus(imp):
     if imp_dimensions[2] != 1:
         sys.exit("Image has more than one channel, please reduce dimensionality")
 
+    n_slices = imp_dimensions[3]
+    n_frames = imp_dimensions[4]
+
+    # coarse-pass sampling distance, invariant across timepoints: scoring the
+    # full stack is wasted effort when the in-focus region is a narrow peak
+    stride = max(1, n_slices // 16)
+
+    # fetch slice processors directly from the stack - unlike setT()/setZ()
+    # plus getProcessor() this doesn't touch the "current slice" state of the
+    # ImagePlus and skips the listener / redraw machinery of GUI-attached
+    # images on every single slice:
+    stack = imp.getStack()
+
     # Loop through each time point
-    for plane in range(1, imp_dimensions[4] + 1):
-        focused_slice = 0
-        norm_var = 0
-        imp.setT(plane)
-        # Loop through each z plane
-        for current_z in range(1, imp_dimensions[3] + 1):
-            imp.setZ(current_z)
-            pix_array = imp.getProcessor().getPixels()
-            mean = (sum(pix_array)) / len(pix_array)
-            pix_array = [(x - mean) * (x - mean) for x in pix_array]
-            # pix_array = pix_array*pix_array
-
-            sumpix_array = sum(pix_array)
-            var = sumpix_array / (imp_dimensions[0] * imp_dimensions[1] * mean)
-
-            if var > norm_var:
-                norm_var = var
-                focused_slice = current_z
+    for plane in range(1, n_frames + 1):
+        scores = {}
+
+        best_score = 0
+        decline = 0
+        for current_z in range(1, n_slices + 1, stride):
+            ip = stack.getProcessor(imp.getStackIndex(1, current_z, plane))
+            score = _focus_score_fft(ip)
+            scores[current_z] = score
+            if score > best_score:
+                best_score = score
+                decline = 0
+            else:
+                decline += 1
+                if early_stop_planes and decline >= early_stop_planes:
+                    break
+        z_peak = max(scores, key=scores.get)
+
+        # fine pass: evaluate the skipped slices around the coarse peak
+        fine_start = max(1, z_peak - stride)
+        fine_stop = min(n_slices, z_peak + stride)
+        for current_z in range(fine_start, fine_stop + 1):
+            if current_z not in scores:
+                ip = stack.getProcessor(imp.getStackIndex(1, current_z, plane))
+                scores[current_z] = _focus_score_fft(ip)
+
+        focused_slice = max(scores, key=scores.get)
 
     return focused_slice
 
 
+# cache for ImageJ preference values used by `_get_pref()` - they would go
+# through ImageJ's disk-backed prefs layer on every single lookup otherwise:
+_PREFS_CACHE = {}
+
+
+def _get_pref(key):
+    """Look up an ImageJ preference value, caching results for the session.
+
+    Parameters
+    ----------
+    key : str
+        Name of the preference. NOTE: the leading dot "." has to be omitted
+        here, despite being present in the `IJ_Prefs.txt` file!
+
+    Returns
+    -------
+    str
+        The stripped preference value, or an empty string if unset.
+    """
+    value = _PREFS_CACHE.get(key)
+    if value is None:
+        value = prefs.Prefs.get(key, "").strip()
+        _PREFS_CACHE[key] = value
+    return value
+
+
+def clear_prefs_cache():
+    """Empty the preferences cache, forcing fresh lookups on the next call."""
+    _PREFS_CACHE.clear()
+
+
+# pool of SMTP connections (server -> (connection, timestamp of last use)) to
+# avoid re-doing the TCP + SMTP handshake for every single notification email:
+_SMTP_POOL = {}
+_SMTP_POOL_TTL = 100  # maximum age [s] of a pooled connection before reconnecting
+
+
+def _get_smtp(server):
+    """Get a live SMTP connection to the given server, reusing pooled ones.
+
+    Look up the server in the module-level connection pool and return the
+    cached connection in case it is younger than `_SMTP_POOL_TTL` seconds and
+    still responds to a `noop()`. Otherwise (or if no pooled connection
+    exists) a fresh connection is established and placed in the pool.
+
+    Parameters
+    ----------
+    server : str
+        The address of the SMTP server.
+
+    Returns
+    -------
+    smtplib.SMTP
+        A connected SMTP object.
+    """
+    import smtplib
+
+    now = time.time()
+    cached = _SMTP_POOL.get(server)
+    if cached:
+        smtp_obj, last_used = cached
+        if now - last_used < _SMTP_POOL_TTL:
+            try:
+                smtp_obj.noop()
+                _SMTP_POOL[server] = (smtp_obj, now)
+                return smtp_obj
+            except Exception:  # connection went stale, re-establish below
+                log.debug("Pooled SMTP connection to [%s] is dead.", server)
+        try:
+            smtp_obj.quit()
+        except Exception:
+            pass
+        del _SMTP_POOL[server]
+
+    log.debug("Establishing new SMTP connection to [%s]...", server)
+    smtp_obj = smtplib.SMTP(server)
+    _SMTP_POOL[server] = (smtp_obj, now)
+    return smtp_obj
+
+
+def close_smtp_pool():
+    """Close all pooled SMTP connections.
+
+    Registered via `atexit` so the pooled connections are shut down cleanly
+    when the interpreter terminates, may also be called explicitly.
+    """
+    for smtp_obj, _ in _SMTP_POOL.values():
+        try:
+            smtp_obj.quit()
+        except Exception:
+            pass
+    _SMTP_POOL.clear()
+
+
+atexit.register(close_smtp_pool)
+
+
 def send_notification_email(
     job_name, recipient, filename, total_execution_time, subject="", message=""
 ):
@@ -204,8 +394,9 @@ def send_notification_email(
     ----------
     job_name : string
         Job name to display in the email.
-    recipient : string
-        Recipient's email address.
+    recipient : string or list(string)
+        One or more recipient email addresses. When multiple recipients are
+        given, one email per recipient is sent re-using the same connection.
     filename : string
         The name of the file to be passed in the email.
     total_execution_time : str
@@ -223,13 +414,13 @@ def send_notification_email(
     - If these preferences are not set or if required parameters are missing,
       the function logs a message and exits without sending an email.
     - In case of an SMTP error, the function logs a warning.
+    - SMTP connections are pooled and re-used across calls (see `_get_smtp()`),
+      avoiding a full TCP + SMTP handshake for every single notification.
     """
 
-    # Retrieve sender email and SMTP server from preferences
-    # NOTE: the leading dot "." has to be omitted in the `Prefs.get()` call,
-    # despite being present in the `IJ_Prefs.txt` file!
-    sender = prefs.Prefs.get("imcf.sender_email", "").strip()
-    server = prefs.Prefs.get("imcf.smtpserver", "").strip()
+    # Retrieve sender email and SMTP server from the (cached) preferences
+    sender = _get_pref("imcf.sender_email")
+    server = _get_pref("imcf.smtpserver")
 
     # Ensure the sender and server are configured from Prefs
     if not sender:
@@ -241,8 +432,11 @@ def send_notification_email(
 
     log.debug("Using SMTP server [%s].", server)
 
-    # Ensure the recipient is provided
-    if not recipient.strip():
+    # Ensure at least one recipient is provided
+    if not isinstance(recipient, (list, tuple)):
+        recipient = [recipient]
+    recipients = [entry.strip() for entry in recipient if entry and entry.strip()]
+    if not recipients:
         log.info("Recipient email is required, not sending email notification.")
         return
 
@@ -263,21 +457,34 @@ def send_notification_email(
     else:
         body = message
 
-    # Form the complete message
-    message = ("From: {0}\nTo: {1}\nSubject: {2}\n\n{3}").format(
-        sender, recipient, subject, body
-    )
+    import smtplib
 
-    # Try sending the email, print error message if it wasn't possible
+    # Try sending the emails, print error message if it wasn't possible
     try:
-        smtpObj = smtplib.SMTP(server)
-        smtpObj.sendmail(sender, recipient, message)
-        log.debug("Successfully sent email to <%s>.", recipient)
+        smtp_obj = _get_smtp(server)
+        for address in recipients:
+            # Form the complete message
+            message = ("From: {0}\nTo: {1}\nSubject: {2}\n\n{3}").format(
+                sender, address, subject, body
+            )
+            smtp_obj.sendmail(sender, address, message)
+            log.debug("Successfully sent email to <%s>.", address)
     except smtplib.SMTPException as err:
         log.warning("Error: Unable to send email: %s", err)
     return
 
 
+# prebuilt progress bar of full length, sliced into by `progressbar()` so no
+# new bar strings have to be allocated on every tick:
+_BAR_SIZE = 20
+_BAR = "#" * _BAR_SIZE + "." * _BAR_SIZE
+
+# timestamp [ms] of the last progress bar update, used to throttle the log
+# window updates (a Swing EDT round-trip each) to a rate the UI can render:
+_BAR_LAST_UPDATE = [0]
+_BAR_INTERVAL_MS = 33
+
+
 def progressbar(progress, total, line_number, prefix=""):
     """Progress bar for the IJ log window.
 
@@ -294,23 +501,38 @@ def progressbar(progress, total, line_number, prefix=""):
         Number of the line to be updated.
     prefix : str, optional
         Text to use before the progress bar, by default an empty string.
+
+    Notes
+    -----
+    Updates are throttled to one per 33 ms - ticks arriving faster than the
+    log window can render are dropped silently (except for the final one, so
+    completion is always drawn).
     """
 
-    size = 20
-    x = int(size * progress / total)
+    now = int(time.time() * 1000)
+    if progress != total and now - _BAR_LAST_UPDATE[0] < _BAR_INTERVAL_MS:
+        return
+    _BAR_LAST_UPDATE[0] = now
+
+    x = int(_BAR_SIZE * progress / total)
     IJ.log(
-        "\\Update%i:%s[%s%s] %i/%i\r"
+        "\\Update%i:%s[%s] %i/%i\r"
         % (
             line_number,
             timed_log(prefix, True),
-            "#" * x,
-            "." * (size - x),
+            _BAR[_BAR_SIZE - x : 2 * _BAR_SIZE - x],
             progress,
             total,
         )
     )
 
 
+# cache for the formatted timestamp used by `timed_log()`: since the displayed
+# resolution is one second there is no point in re-running localtime/strftime
+# more than once within the same second:
+_TIMESTAMP_CACHE = [0, ""]
+
+
 def timed_log(message, as_string=False):
     """Print a message to the ImageJ log window, prefixed with a timestamp.
 
@@ -325,7 +547,11 @@ def timed_log(message, as_string=False):
         Flag to request the formatted string to be returned instead of printing
         it to the log. By default False.
     """
-    formatted = time.strftime("%H:%M:%S", time.localtime()) + ": " + message + " "
+    now = int(time.time())
+    if now != _TIMESTAMP_CACHE[0]:
+        _TIMESTAMP_CACHE[0] = now
+        _TIMESTAMP_CACHE[1] = time.strftime("%H:%M:%S", time.localtime(now))
+    formatted = _TIMESTAMP_CACHE[1] + ": " + message + " "
     if as_string:
         return formatted
     IJ.log(formatted)
@@ -334,14 +560,21 @@ def timed_log(message, as_string=False):
 def get_free_memory():
     """Get the free memory that is available to ImageJ.
 
+    The counters are read straight from the JVM `Runtime` - unlike
+    `IJ.currentMemory()`, which triggers a full (stop-the-world) garbage
+    collection on some ImageJ builds, making it unsuitable for polling.
+
     Returns
     -------
     free_memory : int
         The free memory in bytes.
     """
-    max_memory = int(IJ.maxMemory())
-    used_memory = int(IJ.currentMemory())
-    free_memory = max_memory - used_memory
+    # NOTE: imported on demand as the class is not covered by the fiji mocks:
+    from java.lang import Runtime
+
+    runtime = Runtime.getRuntime()
+    used_memory = runtime.totalMemory() - runtime.freeMemory()
+    free_memory = runtime.maxMemory() - used_memory
 
     return free_memory
 
@@ -375,6 +608,21 @@ def setup_clean_ij_environment(rm=None, rt=None):  # pylint: disable-msg=unused-
     prefs.fix_ij_options()
 
 
+# sanitization rules for `sanitize_image_title()`, compiled into a single
+# pattern once so all replacements happen in one pass over the title (instead
+# of one full traversal plus intermediate string per rule):
+_TITLE_REPLACEMENTS = {
+    ".czi": "",
+    "_-_": "",
+    "__": "_",
+    "#": "Series",
+    " ": "_",
+}
+_TITLE_PATTERN = re.compile(
+    "|".join(re.escape(rule) for rule in [".czi", "_-_", "__", "#", " "])
+)
+
+
 def sanitize_image_title(imp):
     """Remove special chars and various suffixes from the title of an ImagePlus.
 
@@ -391,16 +639,14 @@ def sanitize_image_title(imp):
     # sometimes (unclear when) the title contains the full path, therefore we
     # simply call `os.path.basename()` on it to remove all up to the last "/":
     image_title = os.path.basename(imp.getTitle())
-    image_title = image_title.replace(".czi", "")
-    image_title = image_title.replace(" ", "_")
-    image_title = image_title.replace("_-_", "")
-    image_title = image_title.replace("__", "_")
-    image_title = image_title.replace("#", "Series")
+    image_title = _TITLE_PATTERN.sub(
+        lambda match: _TITLE_REPLACEMENTS[match.group(0)], image_title
+    )
 
     imp.setTitle(image_title)
 
 
-def subtract_images(imp1, imp2):
+def subtract_images(imp1, imp2, inplace=False):
     """Subtract one image from the other (imp1 - imp2).
 
     Parameters
@@ -409,6 +655,12 @@ def subtract_images(imp1, imp2):
         The ImagePlus that is to be subtracted from.
     imp2: ij.ImagePlus
         The ImagePlus that is to be subtracted.
+    inplace: bool, optional
+        If set to True the subtraction is done directly on `imp1` (which is
+        then also the returned ImagePlus) instead of allocating a new result
+        image. This halves the memory traffic of the (memory-bound) operation
+        and is the preferred choice when the caller discards `imp1` anyway.
+        By default False.
 
     Returns
     -------
@@ -416,6 +668,9 @@ def subtract_images(imp1, imp2):
         The ImagePlus resulting from the subtraction.
     """
     ic = ImageCalculator()
+    if inplace:
+        ic.run("Subtract", imp1, imp2)
+        return imp1
     subtracted = ic.run("Subtract create", imp1, imp2)
 
     return subtracted
@@ -428,10 +683,24 @@ def close_images(list_of_imps):
     ----------
     list_of_imps: list(ij.ImagePlus)
         A list of open ImagePlus objects.
+
+    Notes
+    -----
+    The images are closed with the macro interpreter's batch mode enabled,
+    suppressing the AWT repaint that every single `close()` would schedule
+    otherwise on GUI-attached images.
     """
-    for imp in list_of_imps:
-        imp.changes = False
-        imp.close()
+    # NOTE: imported on demand as the class is not covered by the fiji mocks:
+    from ij.macro import Interpreter
+
+    previous_mode = Interpreter.batchMode
+    Interpreter.batchMode = True
+    try:
+        for imp in list_of_imps:
+            imp.changes = False
+            imp.close()
+    finally:
+        Interpreter.batchMode = previous_mode
 
 
 def get_threshold_value_from_method(imp, method, ops):
@@ -509,18 +778,21 @@ def write_ordereddict_to_csv(out_file, content):
         2;Sample B;37.2
     """
 
-    # Check if the output file exists
-    if not os.path.exists(out_file):
-        # If the file does not exist, create it and write the header
-        with open(out_file, "wb") as f:
-            dict_writer = csv.DictWriter(f, content[0].keys(), delimiter=";")
-            dict_writer.writeheader()
-            dict_writer.writerows(content)
-    else:
-        # If the file exists, append the results
-        with open(out_file, "ab") as f:
-            dict_writer = csv.DictWriter(f, content[0].keys(), delimiter=";")
-            dict_writer.writerows(content)
+    import csv
+
+    # extract the column order once, `DictWriter` would re-do one dict lookup
+    # per field and row instead:
+    keys = content[0].keys()
+
+    # opening in append mode also creates the file in case it doesn't exist,
+    # saving the extra `os.path.exists()` stat call (and the race that goes
+    # with it) - whether the header still needs to be written can be derived
+    # from the file position:
+    with open(out_file, "ab") as f:
+        writer = csv.writer(f, delimiter=";")
+        if f.tell() == 0:
+            writer.writerow(keys)
+        writer.writerows([row[key] for key in keys] for row in content)
 
 
 def save_image_in_format(imp, format, out_dir, series, pad_number, split_channels):
@@ -594,18 +866,10 @@ def save_image_in_format(imp, format, out_dir, series, pad_number, split_channel
     dir_to_save = []
 
     if split_channels:
-        for channel in range(1, imp.getNChannels() + 1):
-            imp_to_use.append(
-                Duplicator().run(
-                    imp,
-                    channel,
-                    channel,
-                    1,
-                    imp.getNSlices(),
-                    1,
-                    imp.getNFrames(),
-                )
-            )
+        # ChannelSplitter re-uses the backing pixel arrays where possible, so
+        # unlike duplicating each channel this doesn't double peak memory:
+        for channel, channel_imp in enumerate(ChannelSplitter.split(imp), 1):
+            imp_to_use.append(channel_imp)
             dir_to_save.append(os.path.join(out_dir, "C" + str(channel)))
     else:
         imp_to_use.append(imp)
@@ -634,6 +898,12 @@ def save_image_in_format(imp, format, out_dir, series, pad_number, split_channel
         current_imp.close()
 
 
+# cache for `locate_latest_imaris()` results, keyed by the checked paths - the
+# set of installed Imaris versions won't change during an ImageJ session, so
+# there is no point in re-scanning the filesystem on every call:
+_IMARIS_PATH_CACHE = {}
+
+
 def locate_latest_imaris(paths_to_check=None):
     """Find paths to latest installed Imaris or ImarisFileConverter version.
 
@@ -641,6 +911,10 @@ def locate_latest_imaris(paths_to_check=None):
     ImarisFileConverter or Imaris installation folder with the latter one having
     priority. In case nothing is found, an empty string is returned.
 
+    Results are cached in a module-level dict (keyed by the given paths), so
+    the filesystem scan happens only once per session for a given set of
+    locations.
+
     Parameters
     ----------
     paths_to_check: list of str, optional
@@ -651,6 +925,10 @@ def locate_latest_imaris(paths_to_check=None):
     -------
     str
     """
+    cache_key = tuple(paths_to_check) if paths_to_check else ()
+    if cache_key in _IMARIS_PATH_CACHE:
+        return _IMARIS_PATH_CACHE[cache_key]
+
     if not paths_to_check:
         paths_to_check = [
             r"C:\Program Files\Bitplane\ImarisFileConverter ",
@@ -660,12 +938,30 @@ def locate_latest_imaris(paths_to_check=None):
     imaris_paths = [""]
 
     for check in paths_to_check:
-        hits = glob.glob(check + "*")
+        # a plain prefix match on the parent directory listing is all that is
+        # needed here, no point in having glob run fnmatch on every entry
+        # (`os.scandir` would be preferable but doesn't exist in Jython 2.7):
+        parent, prefix = os.path.split(check)
+        try:
+            hits = [
+                os.path.join(parent, name)
+                for name in os.listdir(parent)
+                if name.startswith(prefix)
+            ]
+        except OSError:
+            hits = []
+        # sort by the version number as a tuple of ints - squashing the dots
+        # and parsing the remainder as a single number would order e.g. "9.5"
+        # (-> 95) after "9.4.1" (-> 941):
+        check_len = len(check)
         imaris_paths += sorted(
             hits,
-            key=lambda x: float(x.replace(check, "").replace(".", "")),
+            key=lambda x: tuple(
+                int(part) for part in x[check_len:].split(".") if part.isdigit()
+            ),
         )
 
+    _IMARIS_PATH_CACHE[cache_key] = imaris_paths[-1]
     return imaris_paths[-1]
 
 
@@ -681,6 +977,8 @@ def run_imarisconvert(file_path):
     file_path : str
         Absolute path to the input image file.
     """
+    import subprocess
+
     # in case the given file has the suffix `.ids` (meaning it is part of an
     # ICS-1 `.ics`+`.ids` pair), point ImarisConvert to the `.ics` file instead:
     path_root, file_extension = os.path.splitext(file_path)
@@ -690,13 +988,20 @@ def run_imarisconvert(file_path):
 
     imaris_path = locate_latest_imaris()
 
-    command = 'ImarisConvert.exe  -i "%s" -of Imaris5 -o "%s"' % (
+    # call the converter binary directly (no `shell=True`), saving the extra
+    # cmd.exe process and avoiding any quoting / injection issues:
+    command = [
+        os.path.join(imaris_path, "ImarisConvert.exe"),
+        "-i",
         file_path,
+        "-of",
+        "Imaris5",
+        "-o",
         file_path.replace(file_extension, ".ims"),
-    )
-    log.debug("\n%s" % command)
+    ]
+    log.debug("\n%s" % " ".join(command))
     IJ.log("Converting to Imaris5 .ims...")
-    result = subprocess.call(command, shell=True, cwd=imaris_path)
+    result = subprocess.call(command)
     if result == 0:
         IJ.log("Conversion to .ims is finished.")
     else:
@@ -14,6 +14,9 @@ requires the [`omero-insight`][omero-insight] plugin to read metadata.
 [omero-insight]: https://github.com/ome/omero-insight
 """
 
+import atexit
+import re
+
 from fr.igred.omero import Client
 from fr.igred.omero.annotations import (
     MapAnnotationWrapper,
@@ -22,10 +25,40 @@ from fr.igred.omero.annotations import (
 from fr.igred.omero.roi import ROIWrapper
 from java.lang import Long
 from java.text import SimpleDateFormat
-from java.util import ArrayList
 from omero.cmd import OriginalMetadataRequest
 from omero.gateway.model import TableData, TableDataColumn
 
+# date formatters used by `get_acquisition_metadata()`, created once per
+# pattern: parsing the pattern in the SimpleDateFormat constructor is
+# surprisingly costly when done per image of e.g. a whole plate - NOTE: they
+# are instantiated lazily, as doing so at import time would break under the
+# (non-functional) fiji mocks
+_DATE_FORMATS = {}
+
+# matches the object references in an OMERO.web URL, e.g. "image-123456" or
+# "dataset-987" (also the "image=123456" query-string variant), used by
+# `parse_url()` to extract all IDs in a single scan
+_OMERO_ID_PATTERN = re.compile(r"(dataset|image)[-=](\d+)")
+
+
+def _get_date_format(pattern):
+    """Get a cached SimpleDateFormat for the given pattern.
+
+    Parameters
+    ----------
+    pattern : str
+        The date pattern, e.g. `yyyy-MM-dd`.
+
+    Returns
+    -------
+    java.text.SimpleDateFormat
+    """
+    date_format = _DATE_FORMATS.get(pattern)
+    if date_format is None:
+        date_format = SimpleDateFormat(pattern)
+        _DATE_FORMATS[pattern] = date_format
+    return date_format
+
 
 def parse_url(client, omero_str):
     """Parse an OMERO URL / image IDs into the respective ImageWrapper objects.
@@ -57,67 +90,73 @@ def parse_url(client, omero_str):
     >>> for wrapper in img_wrappers:
     >>>    imp = wpr.toImagePlus(client)
     """
-    image_ids = []
-    dataset_ids = []
-    image_wpr_list = []
-
-    # Check if the url is a dataset
-    if "dataset-" in omero_str:
-        # If there are multiple datasets
-        if "|" in omero_str:
-            parts = omero_str.split("|")
-            for part in parts:
-                if "dataset-" in part:
-                    image_ids.extend(
-                        [
-                            image
-                            for image in client.getDataset(
-                                Long(part.split("dataset-")[1].split("/")[0])
-                            ).getImages()
-                        ]
-                    )
-                    dataset_id = Long(part.split("dataset-")[1].split("/")[0])
-                    dataset_ids.append(dataset_id)
+    return list(iter_images(client, omero_str))
+
+
+def iter_images(client, omero_str):
+    """Iterate over the ImageWrappers referenced by an OMERO URL / ID string.
+
+    Generator variant of `parse_url()`: wrappers are yielded as soon as their
+    reference has been parsed, in the order they appear in the input. This
+    allows a consumer (e.g. a parallel fetch submitter) to start working on
+    the first images while the tail of a long selection URL is still being
+    processed, instead of waiting for the fully materialized list.
+
+    Parameters
+    ----------
+    client : fr.igred.omero.Client
+        Client used for login to OMERO.
+    omero_str : str
+        Either an URL from OMERO or image IDs separated by commas.
+
+    Yields
+    ------
+    fr.igred.omero.repository.ImageWrapper
+        One wrapper per referenced image.
+    """
+    # fast path: a single plain numeric ID is the most common input by far,
+    # skip the URL scan (and the comma-split machinery) entirely for it:
+    if omero_str.isdigit():
+        yield client.getImage(Long(omero_str))
+        return
+
+    # extract all "dataset-<ID>" / "image-<ID>" references in a single scan
+    # over the string instead of repeated substring checks and splits:
+    found = False
+    for match in _OMERO_ID_PATTERN.finditer(omero_str):
+        found = True
+        if match.group(1) == "image":
+            yield client.getImage(Long(match.group(2)))
         else:
-            image_ids.extend(
-                [
-                    image
-                    for image in client.getDataset(
-                        Long(omero_str.split("dataset-")[1].split("/")[0])
-                    ).getImages()
-                ]
-            )
-            # If there is only one dataset
-            dataset_id = Long(omero_str.split("dataset-")[1].split("/")[0])
-            dataset_ids.append(dataset_id)
-
-        # Get the images from the dataset
-        for dataset_id in dataset_ids:
-            dataset_wpr = client.getDataset(dataset_id)
-            image_wpr_list.extend(dataset_wpr.getImages())
-
-        return image_wpr_list
-
-    # Check if the url is an image
-    elif "image-" in omero_str:
-        image_ids = omero_str.split("image-")
-        image_ids.pop(0)
-        image_ids = [s.split("%")[0].replace("|", "") for s in image_ids]
-    else:
-        image_ids = (
-            [s.split("%")[0].replace("|", "") for s in omero_str.split("image-")[1:]]
-            if "image-" in omero_str
-            else omero_str.split(",")
-        )
-        # If it is a list of IDs separated by commas
-        image_ids = omero_str.split(",")
+            for image_wpr in client.getDataset(Long(match.group(2))).getImages():
+                yield image_wpr
 
-    return [client.getImage(Long(image_id)) for image_id in image_ids]
+    # no URL-style references, treat it as a plain list of comma-separated IDs
+    if not found:
+        # NOTE: imported on demand as the module is not covered by the mocks:
+        from jarray import array
+
+        # resolve all IDs through a single getImages() call (one server-side
+        # query) instead of issuing one getImage round-trip per ID:
+        ids = array([Long(image_id) for image_id in omero_str.split(",")], Long)
+        for image_wpr in client.getImages(ids):
+            yield image_wpr
+
+
+# pool of connected clients keyed by (host, port, username) - workflows that
+# call `connect()` repeatedly (once per batch or per group switch) re-use the
+# live session instead of paying the TLS handshake and login again:
+_CLIENT_POOL = {}
 
 
 def connect(host, port, username, password):
     """Connect to OMERO using the credentials provided.
 
+    Connections are pooled per (host, port, username): if a live client for
+    those coordinates exists already it is returned as-is, otherwise (also if
+    the pooled session went stale) a fresh login is performed. All pooled
+    connections are disconnected at interpreter exit, see `disconnect_all()`.
+
     Parameters
     ----------
     host : str
@@ -134,16 +173,39 @@ def connect(host, port, username, password):
     fr.igred.omero.Client
         A Client object representing the connection to the OMERO server.
     """
+    pool_key = (host, port, username)
+    client = _CLIENT_POOL.get(pool_key)
+    if client is not None and client.isConnected():
+        return client
+
     # Create a new OMERO client
     client = Client()
 
     # Connect to the OMERO server using provided credentials
     client.connect(host, port, username, password)
 
-    # Return the connected client
+    # Pool and return the connected client
+    _CLIENT_POOL[pool_key] = client
     return client
 
 
+def disconnect_all():
+    """Disconnect all pooled OMERO clients.
+
+    Registered via `atexit` to avoid leaking server-side sessions when the
+    interpreter terminates, may also be called explicitly.
+    """
+    for client in _CLIENT_POOL.values():
+        try:
+            client.disconnect()
+        except Exception:
+            pass
+    _CLIENT_POOL.clear()
+
+
+atexit.register(disconnect_all)
+
+
 def fetch_image(client, image_id):
     """Fetch an image from an OMERO server and open it as an ImagePlus.
 
@@ -167,6 +229,46 @@ def fetch_image(client, image_id):
     return image_wpr.toImagePlus()
 
 
+def fetch_images(client, image_ids, max_workers=8):
+    """Fetch several images from OMERO concurrently.
+
+    Fetching is dominated by network round-trips and server-side rendering
+    latency, so a serial loop leaves the client idle most of the time.
+    Dispatch the individual fetches through a bounded thread pool instead -
+    the worker count is capped to stay friendly to the server.
+
+    Parameters
+    ----------
+    client : fr.igred.omero.Client
+        The client object used to connect to the OMERO server.
+    image_ids : list(int)
+        The IDs of the images to fetch.
+    max_workers : int, optional
+        Upper bound for the number of parallel fetches, by default 8.
+
+    Returns
+    -------
+    list(ij.ImagePlus)
+        The fetched images, in the same order as the given IDs.
+    """
+    # NOTE: imported on demand as these are not covered by the fiji mocks:
+    from java.util.concurrent import Callable, Executors
+
+    class _FetchTask(Callable):
+        def __init__(self, image_id):
+            self.image_id = image_id
+
+        def call(self):
+            return fetch_image(client, self.image_id)
+
+    pool = Executors.newFixedThreadPool(min(max_workers, len(image_ids) or 1))
+    try:
+        futures = pool.invokeAll([_FetchTask(image_id) for image_id in image_ids])
+        return [future.get() for future in futures]
+    finally:
+        pool.shutdown()
+
+
 def upload_image_to_omero(user_client, path, dataset_id):
     """Upload an image to OMERO.
 
@@ -184,7 +286,128 @@ def upload_image_to_omero(user_client, path, dataset_id):
     Long
         ID of the uploaded image
     """
-    return user_client.getDataset(Long(dataset_id)).importImage(user_client, path)[0]
+    return find_dataset(user_client, dataset_id).importImage(user_client, path)[0]
+
+
+def upload_images_to_omero(
+    user_client, paths, dataset_id, chunk_size=64, checkpoint_path=None
+):
+    """Upload a batch of image files to a single OMERO dataset.
+
+    The target dataset is resolved once and the paths are handed to
+    `importImages()` in chunks, so the whole import machinery (store, reader,
+    error handler) is set up once per chunk instead of once per file as with
+    repeated `upload_image_to_omero()` calls. Chunking (instead of one giant
+    call) bounds candidate-discovery time and peak memory for very large
+    batches and provides natural checkpoint boundaries.
+
+    Parameters
+    ----------
+    user_client : fr.igred.omero.Client
+        The client object used to connect to the OMERO server.
+    paths : list(str)
+        Paths of the files to upload back to OMERO.
+    dataset_id : Long
+        ID of the dataset where to upload the files.
+    chunk_size : int, optional
+        Number of files to hand to a single `importImages()` call, by
+        default 64.
+    checkpoint_path : str, optional
+        Path of a JSON checkpoint file. When given, the already-uploaded
+        paths and the collected image IDs are recorded there after every
+        chunk and read back on start - an interrupted batch can simply be
+        re-run and will skip everything that already made it to the server.
+        By default None, meaning no checkpointing.
+
+    Returns
+    -------
+    list(int)
+        IDs of the uploaded images (including the ones recorded in the
+        checkpoint by a previous, interrupted run).
+    """
+    import json
+    import os
+
+    # NOTE: imported on demand as these are not covered by the fiji mocks:
+    from jarray import array
+    from java.lang import String
+
+    dataset_wpr = find_dataset(user_client, dataset_id)
+
+    state = {"done": [], "ids": []}
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        with open(checkpoint_path, "r") as infile:
+            state = json.load(infile)
+
+    done = set(state["done"])
+    remaining = [path for path in paths if path not in done]
+
+    for start in range(0, len(remaining), chunk_size):
+        chunk = remaining[start : start + chunk_size]
+        ids = dataset_wpr.importImages(user_client, array(chunk, String))
+        state["ids"].extend(int(image_id) for image_id in ids)
+        state["done"].extend(chunk)
+        if checkpoint_path:
+            with open(checkpoint_path, "w") as outfile:
+                json.dump(state, outfile)
+
+    return state["ids"]
+
+
+def upload_images_and_annotate(user_client, entries, dataset_id):
+    """Upload images and attach their key-value annotations, pipelined.
+
+    The imports themselves run strictly sequentially (the import machinery is
+    not thread-safe), but each image's annotation is attached from a single
+    background worker thread: the short annotation RPC overlaps with the next
+    (much longer) file import instead of being serialized after it.
+
+    Parameters
+    ----------
+    user_client : fr.igred.omero.Client
+        The client object used to connect to the OMERO server.
+    entries : list of (str, dict, str)
+        One tuple per file to upload, consisting of the file path, the
+        key-value pairs to attach (may be empty) and the annotation
+        header / namespace (see `add_keyvalue_annotation()`).
+    dataset_id : Long
+        ID of the dataset where to upload the files.
+
+    Returns
+    -------
+    list(Long)
+        IDs of the uploaded images, in upload order.
+    """
+    # NOTE: imported on demand as these are not covered by the fiji mocks:
+    from java.lang import Runnable
+    from java.util.concurrent import Executors, TimeUnit
+
+    class _AnnotateTask(Runnable):
+        def __init__(self, image_id, annotations, header):
+            self.image_id = image_id
+            self.annotations = annotations
+            self.header = header
+
+        def run(self):
+            image_wpr = user_client.getImage(Long(self.image_id))
+            add_keyvalue_annotation(
+                user_client, image_wpr, self.annotations, self.header
+            )
+
+    pool = Executors.newFixedThreadPool(1)
+    image_ids = []
+    try:
+        for path, annotations, header in entries:
+            image_id = upload_image_to_omero(user_client, path, dataset_id)
+            image_ids.append(image_id)
+            if annotations:
+                pool.submit(_AnnotateTask(image_id, annotations, header))
+    finally:
+        # wait for the remaining annotation RPCs to drain before returning
+        pool.shutdown()
+        pool.awaitTermination(3600, TimeUnit.SECONDS)
+
+    return image_ids
 
 
 def add_keyvalue_annotation(client, repository_wpr, annotations, header):
@@ -208,6 +431,33 @@ def add_keyvalue_annotation(client, repository_wpr, annotations, header):
     repository_wpr.addMapAnnotation(client, map_annotation_wpr)
 
 
+def add_keyvalue_annotations(client, repository_wprs, annotations, header):
+    """Add the same annotation to several OMERO objects at once.
+
+    The key-value pairs are stored as a *single* MapAnnotation on the server
+    which is then linked to every given object - compared to calling
+    `add_keyvalue_annotation()` in a loop this creates one annotation instead
+    of N, leaving only the (cheap) link operation per object.
+
+    Parameters
+    ----------
+    client : fr.igred.omero.Client
+        The client object used to connect to the OMERO server.
+    repository_wprs : list(fr.igred.omero.repositor.GenericRepositoryObjectWrapper)
+        Wrappers of the objects to annotate.
+    annotations : dict
+        Dictionary with the annotation to add.
+    header : str
+        Name for the annotation header.
+    """
+    map_annotation_wpr = MapAnnotationWrapper(annotations)
+    map_annotation_wpr.setNameSpace(header)
+    # the first call saves the annotation on the server, subsequent ones only
+    # link the (now persisted) annotation to the remaining objects:
+    for repository_wpr in repository_wprs:
+        repository_wpr.addMapAnnotation(client, map_annotation_wpr)
+
+
 def delete_keyvalue_annotations(user_client, object_wrapper):
     """Delete annotations linked to object.
 
@@ -223,9 +473,19 @@ def delete_keyvalue_annotations(user_client, object_wrapper):
     user_client.delete(kv_pairs)
 
 
+# cache of resolved dataset wrappers keyed by (client, dataset ID) - per-file
+# upload loops targeting the same dataset shouldn't re-issue the lookup RPC
+# for every single file:
+_DATASET_CACHE = {}
+
+
 def find_dataset(client, dataset_id):
     """Retrieve a dataset (wrapper) from the OMERO server.
 
+    The resolved wrapper is cached per client and dataset ID, so repeated
+    calls for the same target (e.g. from an upload loop) hit the server only
+    once.
+
     Parameters
     ----------
     client : fr.igred.omero.Client
@@ -238,8 +498,13 @@ def find_dataset(client, dataset_id):
     fr.igred.omero.repositor.DatasetWrapper
         The dataset wrapper retrieved from the server.
     """
-    # Fetch the dataset from the OMERO server using the provided dataset ID
-    return client.getDataset(Long(dataset_id))
+    cache_key = (id(client), str(dataset_id))
+    dataset_wpr = _DATASET_CACHE.get(cache_key)
+    if dataset_wpr is None:
+        # Fetch the dataset from the OMERO server using the provided dataset ID
+        dataset_wpr = client.getDataset(Long(dataset_id))
+        _DATASET_CACHE[cache_key] = dataset_wpr
+    return dataset_wpr
 
 
 def get_acquisition_metadata(user_client, image_wpr):
@@ -295,15 +560,55 @@ def get_acquisition_metadata(user_client, image_wpr):
             metadata["acquisition_date"] = "NA"
             metadata["acquisition_date_number"] = 0
     else:
-        sdf = SimpleDateFormat("yyyy-MM-dd")
-        metadata["acquisition_date"] = sdf.format(image_wpr.getAcquisitionDate())
+        acquisition_date = image_wpr.getAcquisitionDate()
+        metadata["acquisition_date"] = _get_date_format("yyyy-MM-dd").format(
+            acquisition_date
+        )
+        # format the numeric variant directly instead of de-dashing the string
         metadata["acquisition_date_number"] = int(
-            metadata["acquisition_date"].replace("-", "")
+            _get_date_format("yyyyMMdd").format(acquisition_date)
         )
 
     return metadata
 
 
+# cache for the original-metadata maps fetched by
+# `get_info_from_original_metadata()`, keyed by image ID - every fetch is a
+# full server round-trip (with retry loop), so looking up several fields of
+# the same image must not re-issue the request each time:
+_ORIGINAL_METADATA_CACHE = {}
+
+
+def _get_original_metadata(user_client, image_id):
+    """Fetch (or serve from cache) the original-metadata map of an image.
+
+    Parameters
+    ----------
+    user_client : fr.igred.omero.Client
+        Client used for login to OMERO
+    image_id : int
+        The ID of the image.
+
+    Returns
+    -------
+    dict-like
+        The global metadata map of the image.
+    """
+    metadata_map = _ORIGINAL_METADATA_CACHE.get(image_id)
+    if metadata_map is None:
+        omr = OriginalMetadataRequest(Long(image_id))
+        cmd = user_client.getGateway().submit(user_client.getCtx(), omr)
+        rsp = cmd.loop(5, 500)
+        metadata_map = rsp.globalMetadata
+        _ORIGINAL_METADATA_CACHE[image_id] = metadata_map
+    return metadata_map
+
+
+def clear_metadata_cache():
+    """Empty the original-metadata cache, e.g. before a new batch run."""
+    _ORIGINAL_METADATA_CACHE.clear()
+
+
 def get_info_from_original_metadata(user_client, image_wpr, field):
     """Retrieve information from the original metadata (as opposed to OME-MD).
 
@@ -311,6 +616,10 @@ def get_info_from_original_metadata(user_client, image_wpr, field):
     recovered / identified directly from the *original* metadata. This function
     extracts the corresponding value based on the field identifier.
 
+    The metadata map is fetched from the server only once per image and cached
+    for subsequent lookups (see `clear_metadata_cache()` to bound memory in
+    long batch runs).
+
     Parameters
     ----------
     user_client : fr.igred.omero.Client
@@ -325,10 +634,7 @@ def get_info_from_original_metadata(user_client, image_wpr, field):
     str
         Value of the field
     """
-    omr = OriginalMetadataRequest(Long(image_wpr.getId()))
-    cmd = user_client.getGateway().submit(user_client.getCtx(), omr)
-    rsp = cmd.loop(5, 500)
-    gm = rsp.globalMetadata
+    gm = _get_original_metadata(user_client, image_wpr.getId())
     return gm.get(field).getValue()
 
 
@@ -346,14 +652,13 @@ def create_table_columns(headings):
         List of columns formatted to be uploaded to OMERO.
     """
     table_columns = []
-    # populate the headings
-    for h in range(len(headings)):
-        heading = headings.keys()[h]
-        type = headings.values()[h]
+    # populate the headings - iterating the items directly avoids rebuilding
+    # the full keys() / values() lists on every single column
+    for index, (heading, coltype) in enumerate(headings.items()):
         # OMERO.tables queries don't handle whitespace well
         heading = heading.replace(" ", "_")
         # title_heading = ["Slice", "Label"]
-        table_columns.append(TableDataColumn(heading, h, type))
+        table_columns.append(TableDataColumn(heading, index, coltype))
     # table_columns.append(TableDataColumn("Image", size, ImageData))
     return table_columns
 
@@ -401,10 +706,20 @@ def upload_array_as_omero_table(user_client, table_title, data, columns, image_w
     ... )
     """
 
+    # NOTE: imported on demand as these are not covered by the fiji mocks:
+    from jarray import array
+    from java.lang import Object
+
     dataset_wpr = image_wpr.getDatasets(user_client)[0]
 
     table_columns = create_table_columns(columns)
-    table_data = TableData(table_columns, data)
+    # assemble the values column-major into pre-sized Java Object[] arrays,
+    # matching TableData's internal layout - this way the gateway doesn't
+    # have to transpose and box the row-major Python lists itself:
+    columnar_data = []
+    for index in range(len(table_columns)):
+        columnar_data.append(array([row[index] for row in data], Object))
+    table_data = TableData(table_columns, columnar_data)
     table_wpr = TableWrapper(table_data)
     table_wpr.setName(table_title)
     dataset_wpr.addTable(user_client, table_wpr)
@@ -423,9 +738,11 @@ def save_rois_to_omero(user_client, image_wpr, rm):
         ROI Manager containing the ROIs
 
     """
+    # NOTE: imported on demand as the class is not covered by the fiji mocks:
+    from java.util import Arrays
+
     rois_list = rm.getRoisAsArray()
-    rois_arraylist = ArrayList(len(rois_list))
-    for roi in rois_list:
-        rois_arraylist.add(roi)
-    rois_to_upload = ROIWrapper.fromImageJ(rois_arraylist)
+    # Arrays.asList() wraps the ROI array in a zero-copy List view, saving one
+    # Jython->Java add() call per ROI:
+    rois_to_upload = ROIWrapper.fromImageJ(Arrays.asList(rois_list))
     image_wpr.saveROIs(user_client, rois_to_upload)